@@ -6,15 +6,20 @@ using TortoiseGit/Git from command line.
 Version with interactive conflict management.
 
 Usage:
-    merge_to_svn.py [repository_path]
+    merge_to_svn.py [--dry-run] [--squash] [repository_path]
     
     repository_path: Optional path to the git-svn repository.
                      If not provided, uses the current directory.
+    --dry-run:       Show the SVN DCommit plan, then restore trunk
+                     without sending anything to SVN.
+    --squash:        Send the whole branch as a single SVN revision.
                      
 Examples:
     merge_to_svn.py
     merge_to_svn.py /path/to/repository
     merge_to_svn.py C:\\Users\\user\\projects\\my-repo
+    merge_to_svn.py --dry-run /path/to/repository
+    merge_to_svn.py --squash /path/to/repository
 """
 
 import subprocess
@@ -24,6 +29,9 @@ import time
 import argparse
 from pathlib import Path
 
+# Commit trunk was on before a dry run started, used to restore it
+dry_run_start_sha = None
+
 class Colors:
     """Colors for terminal output"""
     GREEN = '\033[92m'
@@ -116,6 +124,11 @@ def check_merge_in_progress():
     git_dir = Path(".git")
     return (git_dir / "MERGE_HEAD").exists()
 
+def check_squash_in_progress():
+    """Check if there is a squash merge in progress"""
+    git_dir = Path(".git")
+    return (git_dir / "SQUASH_MSG").exists()
+
 def check_rebase_in_progress():
     """Check if there is a rebase in progress"""
     git_dir = Path(".git")
@@ -180,6 +193,8 @@ def resolve_conflicts_interactively():
         print_warning("\nCanceling operation...")
         if check_merge_in_progress():
             run_command("git merge --abort", check=False)
+        elif check_squash_in_progress():
+            run_command("git reset --merge", check=False)
         if check_rebase_in_progress():
             run_command("git rebase --abort", check=False)
         return False
@@ -385,14 +400,53 @@ def svn_rebase():
     print_success("SVN Rebase completed successfully")
     return True
 
-def merge_branch(branch_name, no_ff=True):
-    """Merge a branch into the current branch with conflict handling"""
-    print_step(f"Merging branch {branch_name}...")
-    no_ff_flag = "--no-ff" if no_ff else ""
-    output, code, stderr = run_command(
-        f"git merge {no_ff_flag} {branch_name} -m \"Merge branch '{branch_name}' into trunk\"",
+def build_squash_message(branch_name):
+    """Build a combined commit message for a squashed merge"""
+    message = f"Merge branch '{branch_name}' into trunk"
+    output, code, _ = run_command(
+        f"git log --reverse --format=%s HEAD..{branch_name}",
         check=False
     )
+    if code == 0 and output:
+        subjects = [s.strip() for s in output.strip().split('\n') if s.strip()]
+        if subjects:
+            message += f"\n\nSquashed {len(subjects)} commits:\n"
+            message += "\n".join(f"- {subject}" for subject in subjects)
+    return message + "\n"
+
+def commit_squash(branch_name):
+    """Commit a squashed merge using a generated combined message"""
+    msg_file = Path(".git") / "SQUASH_MSG"
+    
+    # Nothing staged means the branch changes are already on trunk
+    _, code, _ = run_command("git diff --cached --quiet", check=False)
+    if code == 0:
+        print_info(f"Nothing to squash: changes from {branch_name} are already on trunk")
+        if msg_file.exists():
+            msg_file.unlink()
+        return True
+    
+    print_step("Committing squashed merge...")
+    message = build_squash_message(branch_name)
+    msg_file.write_text(message, encoding='utf-8')
+    output, code, _ = run_command(
+        f'git commit -F "{msg_file}"',
+        "Error committing squashed merge"
+    )
+    if code != 0:
+        return False
+    print_success("Squashed merge committed")
+    return True
+
+def merge_branch(branch_name, no_ff=True, squash=False):
+    """Merge a branch into the current branch with conflict handling"""
+    print_step(f"Merging branch {branch_name}...")
+    if squash:
+        command = f"git merge --squash {branch_name}"
+    else:
+        no_ff_flag = "--no-ff" if no_ff else ""
+        command = f"git merge {no_ff_flag} {branch_name} -m \"Merge branch '{branch_name}' into trunk\""
+    output, code, stderr = run_command(command, check=False)
     
     if code != 0:
         # Check if there are conflicts
@@ -401,10 +455,15 @@ def merge_branch(branch_name, no_ff=True):
             print_warning("Merge generated conflicts!")
             if resolve_conflicts_interactively():
                 # Complete the merge
+                if squash:
+                    return commit_squash(branch_name)
                 return complete_merge_or_rebase()
             else:
                 print_error("Cannot complete merge")
-                run_command("git merge --abort", check=False)
+                if squash:
+                    run_command("git reset --merge", check=False)
+                else:
+                    run_command("git merge --abort", check=False)
                 return False
         else:
             print_error(f"Merge failed!")
@@ -412,13 +471,101 @@ def merge_branch(branch_name, no_ff=True):
             print(f"Error: {stderr}")
             return False
     
+    if squash and not commit_squash(branch_name):
+        return False
+    
     print_success(f"Branch {branch_name} merged successfully")
     return True
 
-def svn_dcommit():
+def get_dcommit_history_file():
+    """Get the file where past dcommit timings are stored"""
+    return Path(".git") / "svn-merge-dcommit-history"
+
+def load_dcommit_history():
+    """Load past dcommit runs as (commit_count, seconds) tuples"""
+    history_file = get_dcommit_history_file()
+    if not history_file.exists():
+        return []
+    history = []
+    for line in history_file.read_text(encoding='utf-8').splitlines():
+        try:
+            count, seconds = line.split()
+            history.append((int(count), float(seconds)))
+        except ValueError:
+            continue
+    return history
+
+def record_dcommit_run(commit_count, seconds):
+    """Append a dcommit run to the timing history"""
+    try:
+        with open(get_dcommit_history_file(), 'a', encoding='utf-8') as f:
+            f.write(f"{commit_count} {seconds:.1f}\n")
+    except OSError as e:
+        print_warning(f"Cannot record dcommit timing: {e}")
+
+def estimate_dcommit_duration(commit_count, max_runs=20):
+    """Estimate dcommit duration in seconds from the last past runs"""
+    history = [(c, s) for c, s in load_dcommit_history() if c > 0][-max_runs:]
+    if not history:
+        return None
+    total_commits = sum(c for c, _ in history)
+    total_seconds = sum(s for _, s in history)
+    return commit_count * total_seconds / total_commits
+
+def format_duration(seconds):
+    """Format a duration in seconds for display"""
+    seconds = int(round(seconds))
+    if seconds < 60:
+        return f"{seconds}s"
+    minutes, seconds = divmod(seconds, 60)
+    if minutes < 60:
+        return f"{minutes}m {seconds}s"
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}h {minutes}m"
+
+def plan_dcommit():
+    """List the commits that SVN DCommit would send, using --dry-run"""
+    print_step("Planning SVN DCommit (dry run)...")
+    output, code, _ = run_command(
+        "git svn dcommit --dry-run",
+        "Error during SVN DCommit dry run"
+    )
+    if code != 0:
+        return None
+    
+    # Each commit to be sent is reported as "diff-tree <parent> <commit>"
+    commits = []
+    for line in (output or "").split('\n'):
+        parts = line.split()
+        if len(parts) == 3 and parts[0] == "diff-tree":
+            commits.append(parts[2])
+    return commits
+
+def show_dcommit_plan(commits, max_shown=20):
+    """Show the commits that will be sent and the estimated duration"""
+    print(f"\n{Colors.BOLD}SVN DCommit plan:{Colors.END}")
+    if not commits:
+        print_info("The dry run reported no commits to send")
+        return
+    
+    for i, commit in enumerate(commits[:max_shown], 1):
+        output, _, _ = run_command(f"git log -1 --format=\"%h %s\" {commit}", check=False)
+        print(f"  {i}. {(output or commit).strip()}")
+    if len(commits) > max_shown:
+        print(f"  ... and {len(commits) - max_shown} more")
+    
+    print(f"\n{Colors.BOLD}Commits to send: {len(commits)} (one SVN revision each){Colors.END}")
+    estimate = estimate_dcommit_duration(len(commits))
+    if estimate is not None:
+        print_info(f"Estimated duration: ~{format_duration(estimate)} (based on past runs)")
+    else:
+        print_info("No past runs recorded, cannot estimate duration")
+
+def svn_dcommit(commit_count=None):
     """Perform SVN dcommit to send changes to SVN"""
     print_step("Sending changes to SVN repository (SVN DCommit)...")
     print_warning("This operation may take several minutes...")
+    start = time.time()
     output, code, _ = run_command(
         "git svn dcommit",
         "Error during SVN DCommit"
@@ -426,9 +573,32 @@ def svn_dcommit():
     if code != 0:
         print_error("SVN DCommit failed!")
         return False
+    if commit_count:
+        record_dcommit_run(commit_count, time.time() - start)
     print_success("Changes successfully sent to SVN repository!")
     return True
 
+def restore_trunk(start_sha, trunk_branch):
+    """Restore trunk to the commit it was on before a dry run"""
+    print_step(f"Restoring {trunk_branch} to {start_sha[:10]}...")
+    if check_rebase_in_progress():
+        run_command("git rebase --abort", check=False)
+    _, code, _ = run_command(
+        f"git reset --hard {start_sha}",
+        f"Error restoring {trunk_branch}"
+    )
+    if code != 0:
+        print(f"Run 'git reset --hard {start_sha}' to restore it manually.")
+        return False
+    print_success(f"{trunk_branch} restored")
+    return True
+
+def exit_script(code, restore_sha=None, trunk_branch=None):
+    """Exit, restoring trunk first when a dry run has modified it"""
+    if restore_sha and not restore_trunk(restore_sha, trunk_branch):
+        code = 1
+    sys.exit(code)
+
 def confirm(message):
     """Ask for user confirmation"""
     response = input(f"{Colors.YELLOW}{message} (y/n): {Colors.END}").lower()
@@ -436,6 +606,8 @@ def confirm(message):
 
 def main():
     """Main function"""
+    global dry_run_start_sha
+    
     # Parse command line arguments
     parser = argparse.ArgumentParser(
         description='Automate Git branch merge into SVN trunk with interactive conflict resolution',
@@ -452,6 +624,16 @@ def main():
         action='version',
         version='%(prog)s 1.0.0'
     )
+    parser.add_argument(
+        '--dry-run',
+        action='store_true',
+        help='Show the SVN DCommit plan and stop before sending anything to SVN'
+    )
+    parser.add_argument(
+        '--squash',
+        action='store_true',
+        help='Squash the branch into a single commit so it is sent as one SVN revision'
+    )
     
     args = parser.parse_args()
     
@@ -545,29 +727,62 @@ def main():
     # Summary
     print(f"\n{Colors.BOLD}Operation summary:{Colors.END}")
     print(f"  1. SVN Rebase on {trunk_branch}")
-    print(f"  2. Merge {branch_to_merge} into {trunk_branch}")
+    if args.squash:
+        print(f"  2. Squash merge {branch_to_merge} into {trunk_branch} (single SVN revision)")
+    else:
+        print(f"  2. Merge {branch_to_merge} into {trunk_branch}")
     print(f"  3. Final SVN Rebase")
-    print(f"  4. SVN DCommit to SVN repository")
+    if args.dry_run:
+        print(f"  4. SVN DCommit plan (dry run, nothing is sent)")
+        print(f"  5. Restore {trunk_branch} to its current state")
+    else:
+        print(f"  4. SVN DCommit to SVN repository")
     print(f"\n{Colors.CYAN}ℹ  The script will automatically handle any conflicts{Colors.END}")
     
     if not confirm("\nDo you want to proceed?"):
         print("\nOperation canceled.")
         sys.exit(0)
     
+    # Remember where trunk was so a dry run can restore it on every exit
+    restore_sha = None
+    if args.dry_run:
+        output, _, _ = run_command("git rev-parse HEAD")
+        restore_sha = dry_run_start_sha = output.strip()
+    
     # Step 1: SVN Rebase on trunk
     if not svn_rebase():
-        sys.exit(1)
+        exit_script(1, restore_sha, trunk_branch)
     
     # Step 2: Merge branch
-    if not merge_branch(branch_to_merge):
-        sys.exit(1)
+    if not merge_branch(branch_to_merge, squash=args.squash):
+        exit_script(1, restore_sha, trunk_branch)
     
     # Step 3: Final SVN Rebase
     if not svn_rebase():
-        sys.exit(1)
+        exit_script(1, restore_sha, trunk_branch)
     
     # Step 4: SVN DCommit
-    if not svn_dcommit():
+    commits = plan_dcommit()
+    if commits is None:
+        if args.dry_run:
+            exit_script(1, restore_sha, trunk_branch)
+        print_warning("Cannot plan SVN DCommit, continuing without a preview")
+    else:
+        show_dcommit_plan(commits)
+    
+    if args.dry_run:
+        print_info("\nDry run: nothing was sent to SVN")
+        exit_script(0, restore_sha, trunk_branch)
+    
+    # The plan is informational only: always let git svn decide what to send
+    if commits:
+        prompt = f"\nDo you want to send {len(commits)} commit(s) to SVN?"
+    else:
+        prompt = "\nDo you want to run SVN DCommit?"
+    if not confirm(prompt):
+        print("\nSVN DCommit canceled. The merge is committed locally.")
+        sys.exit(0)
+    if not svn_dcommit(len(commits) if commits else None):
         sys.exit(1)
     
     # Option to delete branch
@@ -596,12 +811,20 @@ if __name__ == "__main__":
             if confirm("\nDo you want to abort the merge in progress?"):
                 run_command("git merge --abort", check=False)
                 print_success("Merge aborted")
+        elif check_squash_in_progress():
+            if confirm("\nDo you want to abort the squash merge in progress?"):
+                run_command("git reset --merge", check=False)
+                print_success("Squash merge aborted")
         
         if check_rebase_in_progress():
             if confirm("\nDo you want to abort the rebase in progress?"):
                 run_command("git rebase --abort", check=False)
                 print_success("Rebase aborted")
         
+        if dry_run_start_sha:
+            print_warning("Dry run interrupted, trunk may contain the merge")
+            print(f"Run 'git reset --hard {dry_run_start_sha}' to restore it.")
+        
         sys.exit(1)
     except Exception as e:
         print_error(f"Unexpected error: {str(e)}")